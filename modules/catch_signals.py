@@ -36,6 +36,8 @@ Behavior:
       program exits with proper code (130 for SIGINT, 143 for SIGTERM)
     - Signal received OUTSIDE protected block: Immediate exit with proper code
     - Exit codes follow Unix convention: 128 + signal_number
+    - Signal handler only records the signal (no logging inside the handler);
+      repeated signals are ignored once the exit is unwinding
 
 Environment Variables:
     None
@@ -45,26 +47,31 @@ Functions:
         Context manager that protects code from immediate signal termination
 
 Author: Jan 🪄
-Version: 1.0
+Version: 1.1
 """
 
 import sys
+import atexit
 import signal
 import logging
-from contextlib import contextmanager
-from typing import Optional, Any
+from typing import Optional, Any, Callable
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Private module-level state (initialized at import time)
 
+_default_logger = logging.getLogger(__name__)
+
+
 class _SignalState:
     """Encapsulates signal handling state."""
 
     def __init__(self):
         self.received_signal: Optional[int] = None  # Signal number (2 for SIGINT, 15 for SIGTERM)
         self.in_protected_block: bool = False
-        self.logger: Any = logging.getLogger(__name__)  # Default logger, can be updated
+        self.exiting: bool = False  # Exit initiated - repeated signals ignored while it unwinds
+        self.immediate_exit: bool = False  # Exit raised from the handler (logged at interpreter exit)
+        self.logger: Any = _default_logger  # Default logger, can be updated
 
 
 _signal_state = _SignalState()
@@ -73,34 +80,70 @@ _signal_state = _SignalState()
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Private helper functions
 
-def _signal_handler(sig: int, frame) -> None:
-    """
-    Internal signal handler called when SIGINT or SIGTERM received.
+def _signal_name(sig: int) -> str:
+    return 'SIGINT' if sig == signal.SIGINT else 'SIGTERM'
 
-    If currently in a protected block, stores the signal for deferred exit.
-    Otherwise, exits immediately with proper exit code (128 + signal_number).
 
-    Args:
-        sig: Signal number (signal.SIGINT=2 or signal.SIGTERM=15)
-        frame: Stack frame (unused, required by signal handler signature)
+def _make_signal_handler(state: _SignalState) -> Callable[[int, Any], None]:
     """
-    global _signal_state
-    logger = _signal_state.logger
+    Build the signal handler with state bound as a closure variable.
+
+    Keeps the handler body to a few attribute writes on a local - no global
+    lookups - since it runs at an arbitrary bytecode boundary of whatever
+    code it interrupts.
+    """
+    exc_info = sys.exc_info
+
+    def _signal_handler(sig: int, frame) -> None:
+        """
+        Internal signal handler called when SIGINT or SIGTERM received.
+
+        Flag-only: records the signal and does no logging or formatting (logging
+        is not safe to run from arbitrary bytecode boundaries). If currently in a
+        protected block, the exit is deferred to the block's end. Otherwise raises
+        SystemExit with proper exit code (128 + signal_number). Signals arriving
+        while the exit is already unwinding are ignored, so cleanup code in
+        finally blocks is not interrupted by a second Ctrl+C. If that SystemExit
+        was caught and swallowed (supervisor loop, framework, pytest), the next
+        signal is handled normally again.
+
+        Args:
+            sig: Signal number (signal.SIGINT=2 or signal.SIGTERM=15)
+            frame: Stack frame (unused, required by signal handler signature)
+        """
+        if state.exiting:
+            if isinstance(exc_info()[1], SystemExit):
+                return  # Exit still unwinding (finally/except/__exit__) - don't interrupt cleanup
+            # Earlier exit was caught and the program carried on - re-arm
+            state.exiting = False
+            state.immediate_exit = False
 
-    signal_name = 'SIGINT' if sig == signal.SIGINT else 'SIGTERM'
-    logger.warning(f"Signal received: {signal_name} (signal {sig}), will exit")
+        state.received_signal = sig
 
-    _signal_state.received_signal = sig
+        if not state.in_protected_block:
+            # Exit immediately with proper exit code (128 + signal_number)
+            # SIGINT (2) -> 130, SIGTERM (15) -> 143
+            state.exiting = True
+            state.immediate_exit = True
+            raise SystemExit(128 + sig)
 
-    if not _signal_state.in_protected_block:
-        # Exit immediately with proper exit code (128 + signal_number)
-        # SIGINT (2) -> 130, SIGTERM (15) -> 143
-        exit_code = 128 + sig
-        logger.info(f"Exiting immediately with code {exit_code}")
-        sys.exit(exit_code)
+    return _signal_handler
+
+
+def _log_immediate_exit() -> None:
+    """Log an exit raised from the signal handler, once it is safe to do so (atexit)."""
+    state = _signal_state
+    if state.immediate_exit:
+        # The SystemExit may have been caught by the program - report what was raised, not the exit status
+        sig = state.received_signal
+        state.logger.warning(f"Signal received: {_signal_name(sig)} (signal {sig}), raised immediate exit with code {128 + sig}")
+
+
+atexit.register(_log_immediate_exit)
 
 
 # Register signal handlers at module import time
+_signal_handler = _make_signal_handler(_signal_state)
 signal.signal(signal.SIGINT, _signal_handler)
 signal.signal(signal.SIGTERM, _signal_handler)
 
@@ -108,8 +151,59 @@ signal.signal(signal.SIGTERM, _signal_handler)
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Public API
 
-@contextmanager
-def assist_signals(logger: Optional[Any] = None):
+class _AssistSignals:
+    """
+    Context manager returned by assist_signals().
+
+    Plain __enter__/__exit__ class instead of @contextmanager - avoids the
+    generator frame and wrapper object on every entry, which matters for short
+    blocks entered in tight loops.
+    """
+
+    __slots__ = ('logger', '_prev_logger')
+
+    def __init__(self, logger: Optional[Any]):
+        self.logger = logger
+        self._prev_logger: Any = None
+
+    def __enter__(self) -> None:
+        state = _signal_state
+
+        # Outermost block entered by a program that caught an earlier signal exit -
+        # that exit is over, start from a clean state
+        if state.exiting and not state.in_protected_block and not isinstance(sys.exc_info()[1], SystemExit):
+            state.received_signal = None
+            state.exiting = False
+            state.immediate_exit = False
+
+        # Activate block's logger (restored on exit, so it doesn't leak into later blocks)
+        self._prev_logger = state.logger
+        if self.logger is not None:
+            state.logger = self.logger
+
+        # Mark as in protected block
+        state.in_protected_block = True
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        state = _signal_state
+
+        # Unmark protected block, restore previously active logger
+        state.in_protected_block = False
+        logger = state.logger
+        state.logger = self._prev_logger
+
+        # If signal was received during protected block, exit now with proper code
+        sig = state.received_signal
+        if sig is not None and not state.exiting:
+            state.exiting = True
+            exit_code = 128 + sig
+            logger.warning(f"Signal received: {_signal_name(sig)} (signal {sig}), will exit")
+            logger.info(f"Protected block completed, exiting with code {exit_code} ({_signal_name(sig)})")
+            sys.exit(exit_code)
+
+
+def assist_signals(logger: Optional[Any] = None) -> _AssistSignals:
     """
     Context manager that protects code from immediate signal termination.
 
@@ -123,8 +217,8 @@ def assist_signals(logger: Optional[Any] = None):
                 Supports any logger with .debug(), .info(), .warning() methods.
                 Compatible with stdlib logging, loguru, or custom loggers.
 
-    Yields:
-        None
+    Returns:
+        Context manager (binds None in `with ... as`)
 
     Examples:
         Basic usage - protect critical operation:
@@ -148,7 +242,8 @@ def assist_signals(logger: Optional[Any] = None):
         ...     os.rename('data.txt', 'data.final')
 
     Notes:
-        - Signal handlers registered at module import time
+        - Signal handlers registered at module import time (once, never re-registered)
+        - Logger applies to its block only; the previous logger is restored on exit
         - Exit codes follow Unix convention: 128 + signal_number
           * SIGINT (signal 2) → exit code 130
           * SIGTERM (signal 15) → exit code 143
@@ -156,24 +251,4 @@ def assist_signals(logger: Optional[Any] = None):
         - Thread safety: Signals are process-wide, state is module-level
         - Not designed for complex multi-threaded signal handling scenarios
     """
-    global _signal_state
-
-    # Update logger if provided
-    if logger is not None:
-        _signal_state.logger = logger
-
-    # Mark as in protected block
-    _signal_state.in_protected_block = True
-
-    try:
-        yield
-    finally:
-        # Unmark protected block
-        _signal_state.in_protected_block = False
-
-        # If signal was received during protected block, exit now with proper code
-        if _signal_state.received_signal is not None:
-            exit_code = 128 + _signal_state.received_signal
-            signal_name = 'SIGINT' if _signal_state.received_signal == signal.SIGINT else 'SIGTERM'
-            _signal_state.logger.info(f"Protected block completed, exiting with code {exit_code} ({signal_name})")
-            sys.exit(exit_code)
+    return _AssistSignals(logger)
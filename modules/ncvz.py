@@ -11,6 +11,9 @@ Key Features:
     - Configurable logging (stdlib, loguru, or custom)
     - Optional environment-based proxy auto-detection
     - Detailed error categorization (timeout, DNS, refused, proxy issues)
+    - Short-lived DNS cache (30s TTL) for repeated probes
+    - Optional result cache (cache_ttl) for polling loops
+    - Concurrent multi-target checks (ncvz_many)
     - Zero external dependencies
 
 Basic Usage:
@@ -41,18 +44,32 @@ Custom Logging:
     >>> ncvz('host', 80, logger=logger)
     True
 
+Result Caching:
+    >>> ncvz('db.internal', 5432, cache_ttl=5.0)  # Probes at most once per 5s
+    True
+    >>> ncvz_auto('https://api.service.com', cache_ttl=30.0)
+    True
+
+Many Targets (concurrent, direct only):
+    >>> ncvz_many([('db.internal', 5432), 'https://api.service.com'], timeout=2.0)
+    {('db.internal', 5432): True, 'https://api.service.com': False}
+
 Environment Variables:
     HTTP_PROXY, HTTPS_PROXY - Used by ncvz_auto() and ncvz_external()
+        (read once on first use - pass proxy= to ncvz() if they change at runtime)
 
 Functions:
-    ncvz(host, port=None, timeout=3.0, proxy=None, logger=None) -> bool
+    ncvz(host, port=None, timeout=3.0, proxy=None, logger=None, cache_ttl=0.0) -> bool
         Main connectivity checker. Accepts host+port or full URL.
         
-    ncvz_auto(host, port=None, timeout=3.0, logger=None) -> bool
+    ncvz_auto(host, port=None, timeout=3.0, logger=None, cache_ttl=0.0) -> bool
         Auto-detect proxy from environment variables. Accepts host+port or URL.
         
-    ncvz_external(host, port=None, timeout=3.0, logger=None) -> bool
+    ncvz_external(host, port=None, timeout=3.0, logger=None, cache_ttl=0.0) -> bool
         Check external host using corporate proxy from environment. Accepts host+port or URL.
+        
+    ncvz_many(targets, timeout=3.0, logger=None) -> dict
+        Check many URLs / (host, port) tuples concurrently (direct connections only).
 
 Error Types Detected:
     - DNS resolution failures
@@ -64,18 +81,57 @@ Error Types Detected:
     - Invalid URL format
 
 Author: Mila 🪄
-Version: 1.1
+Version: 1.3
 """
 
+import os
 import socket
 import time
+import errno
 import logging
-from typing import Optional, Any, Union
+import functools
+import selectors
+from typing import Optional, Any, Union, Iterable
 from urllib.parse import urlparse
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+# Default ports for URL schemes without explicit port
+_DEFAULT_PORTS: dict[str, int] = {'http': 80, 'ws': 80, 'https': 443, 'wss': 443}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_url(url: str) -> tuple[str, int]:
+    """
+    Extract host and port from a full URL (cached - polling loops reuse the same URLs).
+    
+    Raises:
+        ValueError: If URL is invalid or port cannot be determined
+    """
+    parsed = urlparse(url)
+    
+    if not parsed.scheme or not parsed.hostname:
+        raise ValueError(f"Invalid URL (missing scheme/hostname): {url}")
+    
+    # Extract port from URL or use scheme defaults
+    final_port = parsed.port
+    if final_port is None:
+        final_port = _DEFAULT_PORTS.get(parsed.scheme)
+        if final_port is None:
+            # Unknown scheme - require explicit port in URL or raise error
+            raise ValueError(f"Cannot determine port for scheme '{parsed.scheme}' in URL: {url}")
+    
+    return parsed.hostname, final_port
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_proxy(proxy: str) -> tuple[Optional[str], int]:
+    """Extract (host, port) from proxy URL, port defaults to 8080 (cached)."""
+    parsed_proxy = urlparse(proxy)
+    return parsed_proxy.hostname, parsed_proxy.port or 8080
+
+
 def _parse_host_port(url_or_host: str, port: Optional[int] = None) -> tuple[str, int]:
     """
     Extract host and port from URL or host string.
@@ -100,23 +156,7 @@ def _parse_host_port(url_or_host: str, port: Optional[int] = None) -> tuple[str,
     """
     # Check if it looks like a URL (has scheme)
     if '://' in url_or_host:
-        parsed = urlparse(url_or_host)
-        
-        if not parsed.scheme or not parsed.hostname:
-            raise ValueError(f"Invalid URL (missing scheme/hostname): {url_or_host}")
-        
-        # Extract port from URL or use scheme defaults
-        if parsed.port is not None:
-            final_port = parsed.port
-        elif parsed.scheme in ('http', 'ws'):
-            final_port = 80
-        elif parsed.scheme in ('https', 'wss'):
-            final_port = 443
-        else:
-            # Unknown scheme - require explicit port in URL or raise error
-            raise ValueError(f"Cannot determine port for scheme '{parsed.scheme}' in URL: {url_or_host}")
-        
-        return parsed.hostname, final_port
+        return _parse_url(url_or_host)
     else:
         # Not a URL - treat as plain hostname
         if port is None:
@@ -124,12 +164,27 @@ def _parse_host_port(url_or_host: str, port: Optional[int] = None) -> tuple[str,
         return url_or_host, port
 
 
+def _log_enabled(logger: Any, level: int) -> bool:
+    """True if logger would emit at level (loggers without isEnabledFor, e.g. loguru, always True)."""
+    is_enabled_for = getattr(logger, 'isEnabledFor', None)
+    return is_enabled_for is None or is_enabled_for(level)
+
+
+# HTTP CONNECT request template (bytes - formatted with %, no str building/encoding per call)
+_CONNECT_TMPL = b"CONNECT %s:%d HTTP/1.1\r\nHost: %s:%d\r\n\r\n"
+
+# Result cache: (host, port, proxy) -> (checked_at monotonic, verdict). Used only when cache_ttl > 0.
+_RESULT_CACHE_MAX = 256
+_result_cache: dict[tuple[str, int, Optional[str]], tuple[float, bool]] = {}
+
+
 def ncvz(
     host: str, 
     port: Optional[int] = None, 
     timeout: float = 3.0,
     proxy: Optional[str] = None,
-    logger: Optional[Any] = None
+    logger: Optional[Any] = None,
+    cache_ttl: float = 0.0
 ) -> bool:
     """
     Network connectivity check - Python equivalent of `nc -vz HOST PORT`.
@@ -142,6 +197,8 @@ def ncvz(
         timeout: Connection timeout in seconds
         proxy: Optional proxy URL (e.g., 'http://proxy.company.com:8080')
         logger: Optional logger instance (defaults to stdlib logging)
+        cache_ttl: Reuse previous verdict for the same host/port/proxy if younger
+                   than this many seconds (0 = always probe)
         
     Returns:
         True if connection successful, False otherwise
@@ -169,6 +226,10 @@ def ncvz(
         >>> from loguru import logger
         >>> ncvz('http://host:80', logger=logger)
         True
+        
+        # Polling loop - probe at most once per 5 seconds
+        >>> ncvz('db.internal', 5432, cache_ttl=5.0)
+        True
     """
     # Fallback to stdlib logging if no logger provided
     if logger is None:
@@ -181,88 +242,199 @@ def ncvz(
         logger.error(f"ncvz() - Invalid host/URL: {e}")
         return False
     
-    start_time = time.time()
+    # Serve fresh cached verdict without touching the network
+    if cache_ttl > 0:
+        cache_key = (actual_host, actual_port, proxy)
+        cached = _result_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+            logger.debug(f"ncvz({actual_host}:{actual_port}) - Cached result: {cached[1]}")
+            return cached[1]
     
-    try:
-        if proxy:
-            return _check_via_proxy(actual_host, actual_port, timeout, proxy, start_time, logger)
-        else:
-            return _check_direct(actual_host, actual_port, timeout, start_time, logger)
+    start_ns = time.monotonic_ns()
+    
+    if proxy:
+        result = _check_via_proxy(actual_host, actual_port, timeout, proxy, start_ns, logger)
+    else:
+        # Direct socket connection check (inlined - the common case)
+        # connect_ex() reports refused/timeout as errno - no exception on the common failure paths
+        try:
+            err = _connect_ex(actual_host, actual_port, timeout)
+            result = err == 0
             
-    except Exception as e:
-        elapsed = (time.time() - start_time) * 1000
-        logger.error(f"ncvz({actual_host}:{actual_port}) - Unexpected error after {elapsed:.1f}ms: {e}")
-        return False
+            if result:
+                if _log_enabled(logger, logging.INFO):
+                    elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                    logger.info(f"ncvz({actual_host}:{actual_port}) - Connection succeeded in {elapsed:.1f}ms")
+            elif err == errno.ECONNREFUSED:
+                if _log_enabled(logger, logging.WARNING):
+                    elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                    logger.warning(f"ncvz({actual_host}:{actual_port}) - Connection refused after {elapsed:.1f}ms")
+            elif err in _TIMEOUT_ERRNOS:
+                logger.warning(f"ncvz({actual_host}:{actual_port}) - Connection timeout after {timeout}s")
+            elif _log_enabled(logger, logging.ERROR):
+                elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                logger.error(f"ncvz({actual_host}:{actual_port}) - Network unreachable after {elapsed:.1f}ms: [Errno {err}] {os.strerror(err)}")
+                
+        except socket.gaierror as e:
+            logger.error(f"ncvz({actual_host}:{actual_port}) - DNS resolution failed: {e}")
+            result = False
+            
+        except OSError as e:
+            if _log_enabled(logger, logging.ERROR):
+                elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                logger.error(f"ncvz({actual_host}:{actual_port}) - Network unreachable after {elapsed:.1f}ms: {e}")
+            result = False
+            
+        except Exception as e:
+            # e.g. UnicodeError for over-long DNS labels, OverflowError for out-of-range ports
+            if _log_enabled(logger, logging.ERROR):
+                elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                logger.error(f"ncvz({actual_host}:{actual_port}) - Unexpected error after {elapsed:.1f}ms: {e}")
+            result = False
+    
+    if cache_ttl > 0:
+        if len(_result_cache) >= _RESULT_CACHE_MAX and cache_key not in _result_cache:
+            _result_cache.clear()
+        _result_cache[cache_key] = (time.monotonic(), result)
+    return result
+
+
+# DNS cache: (host, port) -> (resolved_at monotonic, getaddrinfo results)
+_DNS_TTL = 30.0
+_DNS_CACHE_MAX = 256
+_dns_cache: dict[tuple[str, int], tuple[float, list]] = {}
 
 
-def _check_direct(host: str, port: int, timeout: float, start_time: float, logger: Any) -> bool:
-    """Direct socket connection check."""
+def _resolve(host: str, port: int, ttl: float = _DNS_TTL) -> list:
+    """getaddrinfo() with a small TTL cache - repeated probes skip the resolver round trip."""
+    key = (host, port)
+    now = time.monotonic()
+    cached = _dns_cache.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    
     try:
-        with socket.create_connection((host, port), timeout=timeout) as sock:
-            elapsed = (time.time() - start_time) * 1000
-            logger.info(f"ncvz({host}:{port}) - Connection succeeded in {elapsed:.1f}ms")
-            return True
-            
-    except socket.timeout:
-        logger.warning(f"ncvz({host}:{port}) - Connection timeout after {timeout}s")
-        return False
-        
-    except socket.gaierror as e:
-        logger.error(f"ncvz({host}:{port}) - DNS resolution failed: {e}")
-        return False
-        
-    except ConnectionRefusedError:
-        elapsed = (time.time() - start_time) * 1000
-        logger.warning(f"ncvz({host}:{port}) - Connection refused after {elapsed:.1f}ms")
-        return False
-        
-    except OSError as e:
-        elapsed = (time.time() - start_time) * 1000
-        logger.error(f"ncvz({host}:{port}) - Network unreachable after {elapsed:.1f}ms: {e}")
-        return False
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror:
+        _dns_cache.pop(key, None)
+        raise
+    
+    if len(_dns_cache) >= _DNS_CACHE_MAX:
+        _dns_cache.clear()
+    _dns_cache[key] = (now, infos)
+    return infos
+
+
+# connect_ex() errno values meaning "timed out" (a timed-out blocking connect reports EWOULDBLOCK)
+_TIMEOUT_ERRNOS = frozenset({errno.ETIMEDOUT, errno.EAGAIN, errno.EWOULDBLOCK, errno.EINPROGRESS})
+
+
+def _connect_ex(host: str, port: int, timeout: float) -> int:
+    """
+    Connectivity probe via connect_ex() - returns errno (0 = connected) instead of raising.
+    
+    Tries each resolved address, returns the first success or the last error.
+    DNS failures still raise socket.gaierror. Cached addresses are dropped on
+    failure (except refused - host answered, address is fine).
+    """
+    err = errno.EHOSTUNREACH
+    for family, socktype, proto, _, sockaddr in _resolve(host, port):
+        try:
+            sock = socket.socket(family, socktype, proto)
+        except OSError as e:
+            # e.g. EAFNOSUPPORT for IPv6 results on hosts with IPv6 disabled - try next address
+            err = e.errno or errno.EHOSTUNREACH
+            continue
+        try:
+            sock.settimeout(timeout)
+            err = sock.connect_ex(sockaddr)
+        finally:
+            sock.close()
+        if err == 0:
+            return 0
+    
+    if err != errno.ECONNREFUSED:
+        _dns_cache.pop((host, port), None)
+    return err
+
+
+def _connect(host: str, port: int, timeout: float) -> socket.socket:
+    """
+    Open TCP connection like socket.create_connection(), but with cached DNS.
+    
+    Raises the last connection error if all resolved addresses fail. Cached
+    addresses are dropped on failure (except refused - host answered, address is fine).
+    """
+    last_error: Optional[OSError] = None
+    for family, socktype, proto, _, sockaddr in _resolve(host, port):
+        sock = None
+        try:
+            # Inside the try: e.g. EAFNOSUPPORT for IPv6 results moves on to the next address
+            sock = socket.socket(family, socktype, proto)
+            sock.settimeout(timeout)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            if sock is not None:
+                sock.close()
+            last_error = e
+    
+    if not isinstance(last_error, ConnectionRefusedError):
+        _dns_cache.pop((host, port), None)
+    raise last_error or OSError(f"getaddrinfo returned no addresses for {host}:{port}")
+
 
+def _status_line(buf: bytearray, n: int) -> str:
+    """Decode first line of raw proxy response (error paths only)."""
+    end = buf.find(b"\r\n", 0, n)
+    return buf[:end if end != -1 else n].decode('ascii', 'replace')
 
-def _check_via_proxy(host: str, port: int, timeout: float, proxy: str, start_time: float, logger: Any) -> bool:
+
+def _check_via_proxy(host: str, port: int, timeout: float, proxy: str, start_ns: int, logger: Any) -> bool:
     """Proxy-based connection check using HTTP CONNECT method."""
     try:
-        parsed_proxy = urlparse(proxy)
-        proxy_host = parsed_proxy.hostname
-        proxy_port = parsed_proxy.port or 8080
+        proxy_host, proxy_port = _parse_proxy(proxy)
         
         if not proxy_host:
             logger.error(f"ncvz({host}:{port}) - Invalid proxy URL: {proxy}")
             return False
             
         # Connect to proxy
-        with socket.create_connection((proxy_host, proxy_port), timeout=timeout) as proxy_sock:
+        with _connect(proxy_host, proxy_port, timeout) as proxy_sock:
+            # Disable Nagle - the CONNECT request is tiny and we block on the reply right away
+            proxy_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
             # Send HTTP CONNECT request
-            connect_request = f"CONNECT {host}:{port} HTTP/1.1\r\nHost: {host}:{port}\r\n\r\n"
-            proxy_sock.send(connect_request.encode())
+            try:
+                host_bytes = host.encode('ascii')
+            except UnicodeEncodeError:
+                host_bytes = host.encode('idna')  # Internationalized domain name
+            proxy_sock.sendall(_CONNECT_TMPL % (host_bytes, port, host_bytes, port))
             
             # Read response
-            response = proxy_sock.recv(1024).decode()
+            buf = bytearray(1024)
+            n = proxy_sock.recv_into(buf)
             
-            # Parse HTTP response - check for 2xx status codes
-            lines = response.split("\r\n")
-            if lines and lines[0]:
-                status_line = lines[0]
-                # Extract status code (e.g., "HTTP/1.1 200 OK" -> "200")
-                parts = status_line.split()
-                if len(parts) >= 2:
+            # Parse HTTP response on raw bytes - check for 2xx status codes
+            # Status code follows the first space (e.g., b"HTTP/1.1 200 OK" -> b"200")
+            if n and buf[0] not in b"\r\n":
+                sp = buf.find(b" ", 0, n)
+                if buf.startswith(b"HTTP/") and sp != -1 and sp + 4 <= n:
                     try:
-                        status_code = int(parts[1])
+                        status_code = int(buf[sp + 1:sp + 4])
                         if 200 <= status_code < 300:  # Any 2xx is success
-                            elapsed = (time.time() - start_time) * 1000
-                            logger.info(f"ncvz({host}:{port}) - Connection via proxy succeeded in {elapsed:.1f}ms (HTTP {status_code})")
+                            if _log_enabled(logger, logging.INFO):
+                                elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                                logger.info(f"ncvz({host}:{port}) - Connection via proxy succeeded in {elapsed:.1f}ms (HTTP {status_code})")
                             return True
                         else:
                             logger.error(f"ncvz({host}:{port}) - Proxy CONNECT failed with HTTP {status_code}")
                             return False
                     except ValueError:
-                        logger.error(f"ncvz({host}:{port}) - Invalid proxy response: {status_line}")
+                        logger.error(f"ncvz({host}:{port}) - Invalid proxy response: {_status_line(buf, n)}")
                         return False
                 else:
-                    logger.error(f"ncvz({host}:{port}) - Malformed proxy response: {status_line}")
+                    logger.error(f"ncvz({host}:{port}) - Malformed proxy response: {_status_line(buf, n)}")
                     return False
             else:
                 logger.error(f"ncvz({host}:{port}) - Empty proxy response")
@@ -277,24 +449,39 @@ def _check_via_proxy(host: str, port: int, timeout: float, proxy: str, start_tim
         return False
         
     except ConnectionRefusedError:
-        elapsed = (time.time() - start_time) * 1000
-        logger.warning(f"ncvz({host}:{port}) - Proxy connection refused after {elapsed:.1f}ms")
+        if _log_enabled(logger, logging.WARNING):
+            elapsed = (time.monotonic_ns() - start_ns) / 1e6
+            logger.warning(f"ncvz({host}:{port}) - Proxy connection refused after {elapsed:.1f}ms")
         return False
         
     except Exception as e:
-        elapsed = (time.time() - start_time) * 1000
-        logger.error(f"ncvz({host}:{port}) - Proxy error after {elapsed:.1f}ms: {e}")
+        if _log_enabled(logger, logging.ERROR):
+            elapsed = (time.monotonic_ns() - start_ns) / 1e6
+            logger.error(f"ncvz({host}:{port}) - Proxy error after {elapsed:.1f}ms: {e}")
         return False
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+_UNSET = object()
+_env_proxy: Any = _UNSET
+
+
+def _get_env_proxy() -> Optional[str]:
+    """Proxy from HTTP_PROXY/HTTPS_PROXY, resolved once per process."""
+    global _env_proxy
+    if _env_proxy is _UNSET:
+        _env_proxy = os.environ.get("HTTP_PROXY") or os.environ.get("HTTPS_PROXY")
+    return _env_proxy
+
+
 # Convenience function for external tests with environment-based proxy detection
 def ncvz_external(
     host: str,
     port: Optional[int] = None,
     timeout: float = 3.0,
-    logger: Optional[Any] = None
+    logger: Optional[Any] = None,
+    cache_ttl: float = 0.0
 ) -> bool:
     """
     Check external host using proxy from environment.
@@ -304,6 +491,7 @@ def ncvz_external(
         port: Target port number (optional if host is a URL)
         timeout: Connection timeout in seconds
         logger: Optional logger instance
+        cache_ttl: Reuse previous verdict if younger than this many seconds (0 = always probe)
         
     Returns:
         True if connection successful, False otherwise
@@ -314,13 +502,12 @@ def ncvz_external(
         >>> ncvz_external('https://api.example.com')
         True
     """
-    import os
-    proxy = os.environ.get("HTTP_PROXY") or os.environ.get("HTTPS_PROXY")
+    proxy = _get_env_proxy()
     if not proxy:
         if logger:
             logger.warning(f"No proxy configured for external check: {host}:{port}")
         return False
-    return ncvz(host, port, timeout, proxy, logger)
+    return ncvz(host, port, timeout, proxy, logger, cache_ttl)
 
 
 # Convenience function for environment-based proxy detection
@@ -328,7 +515,8 @@ def ncvz_auto(
     host: str,
     port: Optional[int] = None,
     timeout: float = 3.0,
-    logger: Optional[Any] = None
+    logger: Optional[Any] = None,
+    cache_ttl: float = 0.0
 ) -> bool:
     """
     Auto-detect proxy from environment variables (HTTP_PROXY, HTTPS_PROXY).
@@ -338,6 +526,7 @@ def ncvz_auto(
         port: Target port number (optional if host is a URL)
         timeout: Connection timeout in seconds
         logger: Optional logger instance
+        cache_ttl: Reuse previous verdict if younger than this many seconds (0 = always probe)
         
     Returns:
         True if connection successful, False otherwise
@@ -347,8 +536,122 @@ def ncvz_auto(
         True
         >>> ncvz_auto('http://internal.service:5432')
         True
+        >>> ncvz_auto('http://internal.service:5432', cache_ttl=10.0)
+        True
     """
-    import os
+    proxy = _get_env_proxy()
+    return ncvz(host, port, timeout, proxy, logger, cache_ttl)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# Concurrent direct checks for many targets (non-blocking connect + selectors)
+def ncvz_many(
+    targets: Iterable[Union[str, tuple[str, int]]],
+    timeout: float = 3.0,
+    logger: Optional[Any] = None
+) -> dict[Union[str, tuple[str, int]], bool]:
+    """
+    Check many targets concurrently - total wait is ~timeout, not N * timeout.
+    
+    All connects are started up front as non-blocking sockets and multiplexed
+    with selectors (epoll/kqueue/select). Direct connections only (no proxy),
+    first resolved address per target.
+    
+    DNS resolution for all targets happens first and is blocking (cached,
+    but NOT bounded by timeout). The timeout window starts once every
+    connect has been started.
+    
+    Args:
+        targets: Iterable of full URLs or (host, port) tuples
+        timeout: Timeout in seconds shared by all connects (after DNS phase)
+        logger: Optional logger instance (defaults to stdlib logging)
+        
+    Returns:
+        Dict mapping each target (as given) to True/False
+        
+    Examples:
+        >>> ncvz_many([('db.internal', 5432), 'https://api.service.com'])
+        {('db.internal', 5432): True, 'https://api.service.com': True}
+        >>> ncvz_many([('10.0.0.%d' % i, 22) for i in range(1, 255)], timeout=1.0)
+        {('10.0.0.1', 22): True, ('10.0.0.2', 22): False, ...}
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    
+    results: dict[Union[str, tuple[str, int]], bool] = {}
+    start_ns = time.monotonic_ns()
+    sel = selectors.DefaultSelector()
+    
+    try:
+        # Start all connects
+        for target in targets:
+            results[target] = False
+            try:
+                if isinstance(target, tuple):
+                    host, port = _parse_host_port(*target)
+                else:
+                    host, port = _parse_host_port(target)
+            except ValueError as e:
+                logger.error(f"ncvz_many() - Invalid host/URL: {e}")
+                continue
+            
+            try:
+                family, socktype, proto, _, sockaddr = _resolve(host, port)[0]
+            except socket.gaierror as e:
+                logger.error(f"ncvz({host}:{port}) - DNS resolution failed: {e}")
+                continue
+            
+            try:
+                sock = socket.socket(family, socktype, proto)
+            except OSError as e:
+                # e.g. EAFNOSUPPORT for an IPv6 address on a host with IPv6 disabled
+                logger.error(f"ncvz({host}:{port}) - Network unreachable: {e}")
+                continue
+            sock.setblocking(False)
+            err = sock.connect_ex(sockaddr)
+            if err in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                sel.register(sock, selectors.EVENT_WRITE, (target, host, port))
+            else:
+                sock.close()
+                logger.error(f"ncvz({host}:{port}) - Network unreachable: {errno.errorcode.get(err, err)}")
+        
+        # Collect completions until all done or deadline hit. Deadline starts
+        # here - slow (blocking) DNS above must not eat the connect window
+        deadline = time.monotonic() + timeout
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                sock = key.fileobj
+                target, host, port = key.data
+                sel.unregister(sock)
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                sock.close()
+                
+                if err == 0:
+                    results[target] = True
+                    if _log_enabled(logger, logging.INFO):
+                        elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                        logger.info(f"ncvz({host}:{port}) - Connection succeeded in {elapsed:.1f}ms")
+                elif err == errno.ECONNREFUSED:
+                    if _log_enabled(logger, logging.WARNING):
+                        elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                        logger.warning(f"ncvz({host}:{port}) - Connection refused after {elapsed:.1f}ms")
+                elif _log_enabled(logger, logging.ERROR):
+                    elapsed = (time.monotonic_ns() - start_ns) / 1e6
+                    logger.error(f"ncvz({host}:{port}) - Network unreachable after {elapsed:.1f}ms: {errno.errorcode.get(err, err)}")
+        
+        # Anything still pending timed out
+        for key in list(sel.get_map().values()):
+            _, host, port = key.data
+            logger.warning(f"ncvz({host}:{port}) - Connection timeout after {timeout}s")
+    
+    finally:
+        for key in list(sel.get_map().values()):
+            sel.unregister(key.fileobj)
+            key.fileobj.close()
+        sel.close()
     
-    proxy = os.environ.get("HTTP_PROXY") or os.environ.get("HTTPS_PROXY")
-    return ncvz(host, port, timeout, proxy, logger)
+    return results
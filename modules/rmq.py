@@ -6,12 +6,14 @@ Specialized for dict-to-dict messaging with flexible authentication and
 configurable logging.
 
 Key Features:
-    - JSON-only payloads (send dict, receive dict)
-    - One-shot send function for infrequent messages
+    - JSON payloads (send dict, receive dict), optional msgpack encoding
+    - One-shot send function (connections pooled and reused across calls)
     - Persistent connection class for high-frequency sending
     - Blocking consumer with manual acknowledgment and retry
+    - Consumer prefetch (basic_qos) and optional batched acks
     - Flexible authentication (explicit username/password or guest default)
     - Configurable logging (stdlib, loguru, or custom)
+    - asyncio facade (AsyncRMQProducer, consume_json_async)
     - Automatic queue declaration
     - Connection health checking and error recovery
 
@@ -19,6 +21,13 @@ External Dependency:
     - Requires 'pika' library: pip install pika
     - This is the ONLY module in python-util-belt with external dependencies
     - Pragmatic choice: RabbitMQ functionality requires AMQP client
+    - Optional: 'orjson' (pip install orjson) - used for JSON when installed
+      (several times faster), falls back to stdlib json otherwise. Data orjson
+      rejects (e.g. ints over 64 bits) is retried with stdlib json. Remaining
+      differences with orjson installed: NaN/Infinity are published as null,
+      ints over 64 bits are received as float, and datetime/UUID/dataclass
+      values serialize instead of failing
+    - Optional: 'msgpack' (pip install msgpack) - only for encoding='msgpack'
 
 Basic Usage (Producer):
     >>> from rmq import send_json
@@ -36,12 +45,31 @@ Persistent Producer (High Frequency):
     True
     True
 
+Batched Producer (Bulk):
+    >>> with RMQProducer('tasks') as producer:
+    ...     producer.send_many([{'id': i} for i in range(1000)], batch_size=100)
+    1000
+
 Consumer (Blocking):
     >>> from rmq import consume_json
     >>> def process(data: dict):
     ...     print(f"Task: {data['task']}")
     >>> consume_json('work_queue', process)  # Blocks forever
 
+Async (asyncio):
+    >>> from rmq import AsyncRMQProducer, consume_json_async
+    >>> async with AsyncRMQProducer('tasks') as producer:
+    ...     await producer.send({'task': 'first'})
+    True
+    >>> async for data in consume_json_async('work_queue'):
+    ...     await handle(data)
+
+Binary Payloads (msgpack):
+    >>> send_json({'readings': [1.5, 2.5]}, 'metrics', encoding='msgpack')
+    True
+    >>> producer = RMQProducer('metrics', encoding='msgpack')
+    >>> consume_json('metrics', process)  # Decodes by content_type, no flag needed
+
 Authentication:
     # Default: guest/guest
     >>> send_json(data, queue)
@@ -70,28 +98,45 @@ Environment Variables:
 
 Functions:
     send_json(data, queue, host='localhost', **kwargs) -> bool
-        One-shot JSON message sender
+        One-shot JSON message sender (pooled connection, pool=False to disable)
 
     RMQProducer(queue, host='localhost', **kwargs)
         Persistent connection producer class
+        (.send(data) -> bool, .send_many(datas, batch_size=100) -> int)
 
     consume_json(queue, callback, host='localhost', **kwargs)
         Blocking consumer (auto-start, blocks forever)
 
+    AsyncRMQProducer(queue, host='localhost', **kwargs)
+        asyncio facade over RMQProducer (await .send() / .send_many())
+
+    consume_json_async(queue, host='localhost', **kwargs) -> AsyncIterator[dict]
+        Async generator consumer (pika runs in a background I/O thread)
+
 Notes:
-    - All functions use dict-to-dict JSON messaging (no raw bytes)
+    - All functions use dict-to-dict messaging (no raw bytes)
+    - Messages carry content_type (application/json or application/msgpack);
+      consumers decode by it and treat messages without one as JSON
     - Consumer uses manual acknowledgment (ack after success, nack+requeue on failure)
+    - Consumer prefetches 100 messages by default (prefetch=0 for unlimited)
     - Payloads over 1MB trigger warnings
     - Connections use heartbeat (default 600s producers, 1200s consumers)
-    - Auto-reconnect NOT implemented (caller should retry on False)
+    - Auto-reconnect NOT implemented (caller should retry on False); only
+      send_json() replaces a dropped pooled connection once per call
 
 Author: Jan 🪄
-Version: 1.0
+Version: 1.6
 """
 
+import os
 import json
+import atexit
+import asyncio
 import logging
-from typing import Optional, Any, Callable
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Callable, AsyncIterator
 
 try:
     import pika
@@ -101,11 +146,49 @@ except ImportError:
         "rmq module requires 'pika' library. Install with: pip install pika"
     )
 
+# Default credentials (immutable, shared by all guest connections)
+_GUEST_CREDENTIALS = pika.PlainCredentials("guest", "guest")
+
+# Optional: orjson for faster (de)serialization, stdlib json used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Stdlib fallback encoder (compact, preserves Unicode) - built once; json.dumps() with
+# non-default arguments constructs a new JSONEncoder on every call
+_json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# Optional: msgpack for compact binary payloads (encoding='msgpack')
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Payload encodings - content_type set on published messages, consumers dispatch on it
+_CONTENT_TYPES = {
+    "json": "application/json",
+    "msgpack": "application/msgpack",
+}
+_MSGPACK_CONTENT_TYPE = _CONTENT_TYPES["msgpack"]
+
+# Message properties per encoding (immutable in practice, shared by all publishes)
+_PROPERTIES = {
+    encoding: pika.BasicProperties(content_type=content_type)
+    for encoding, content_type in _CONTENT_TYPES.items()
+}
+
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Private helper functions
 
 
+def _log_enabled(logger: Any, level: int) -> bool:
+    """True if logger would emit at level (loggers without isEnabledFor, e.g. loguru, always True)."""
+    is_enabled_for = getattr(logger, 'isEnabledFor', None)
+    return is_enabled_for is None or is_enabled_for(level)
+
+
 def _get_connection_params(
     host: str,
     port: int = 5672,
@@ -135,14 +218,42 @@ def _get_connection_params(
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    # Called per send_json() - skip building debug messages unless they will be emitted
+    debug = _log_enabled(logger, logging.DEBUG)
+
     # Priority 1: Explicit parameters
     if username and password:
-        credentials = pika.PlainCredentials(username, password)
-        logger.debug(f"Using explicit credentials for {username}@{host}")
+        if debug:
+            logger.debug(f"Using explicit credentials for {username}@{host}")
     else:
         # Priority 2: Default guest/guest
-        credentials = pika.PlainCredentials("guest", "guest")
-        logger.debug(f"Using default guest credentials for {host}")
+        username = password = None  # Normalized - all guest lookups share one cache entry
+        if debug:
+            logger.debug(f"Using default guest credentials for {host}")
+
+    return _cached_params(host, port, virtual_host, username, password, heartbeat)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_params(
+    host: str,
+    port: int,
+    virtual_host: str,
+    username: Optional[str],
+    password: Optional[str],
+    heartbeat: int
+) -> pika.ConnectionParameters:
+    """
+    Build (and memoize) pika ConnectionParameters - see _get_connection_params().
+
+    Repeated send_json() calls with the same settings reuse one parameters
+    object instead of re-running pika's credential/parameter validation.
+    username/password None means guest/guest.
+    """
+    if username and password:
+        credentials = pika.PlainCredentials(username, password)
+    else:
+        credentials = _GUEST_CREDENTIALS
 
     return pika.ConnectionParameters(
         host=host,
@@ -153,27 +264,111 @@ def _get_connection_params(
     )
 
 
-def _serialize_json(data: dict, logger: Any) -> Optional[str]:
+def _check_encoding(encoding: str) -> None:
+    """
+    Validate payload encoding name (and its optional dependency).
+
+    Args:
+        encoding: 'json' or 'msgpack'
+
+    Raises:
+        ValueError: If encoding is unknown
+        ImportError: If encoding='msgpack' and msgpack is not installed
+    """
+    if encoding not in _CONTENT_TYPES:
+        raise ValueError(f"Unknown encoding '{encoding}' (expected one of: {', '.join(_CONTENT_TYPES)})")
+    if encoding == "msgpack" and msgpack is None:
+        raise ImportError("encoding='msgpack' requires 'msgpack' library. Install with: pip install msgpack")
+
+
+def _raw_encoder(encoding: str) -> Callable[[Any], bytes]:
+    """
+    Bare object -> bytes encoder for the encoding (no logging, no size check).
+
+    For bulk loops that handle errors and sizes inline. Raises TypeError,
+    ValueError or OverflowError on unserializable data.
+    """
+    if encoding == "msgpack":
+        return functools.partial(msgpack.packb, use_bin_type=True)
+    return _dumps_json
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Compact UTF-8 JSON bytes - orjson when installed, stdlib json otherwise.
+
+    Input orjson rejects but stdlib accepts (e.g. ints over 64 bits) is retried
+    with stdlib json, so results don't depend on orjson being installed.
+    Raises TypeError/ValueError on data neither can serialize.
+    """
+    if orjson is not None:
+        try:
+            # OPT_NON_STR_KEYS keeps stdlib behavior for int/float keys
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    # Single UTF-8 encode - the bytes are both measured and published (no re-encode in pika)
+    return _json_encoder.encode(data).encode("utf-8")
+
+
+# Payload size that triggers a warning (1MB)
+_LARGE_PAYLOAD_BYTES = 1_000_000
+
+
+def _warn_if_large(payload: bytes, logger: Any) -> None:
+    """Warn on large payloads (>1MB)."""
+    size_bytes = len(payload)
+    if size_bytes > _LARGE_PAYLOAD_BYTES:
+        size_mb = size_bytes / 1_000_000
+        logger.warning(f"Large payload: {size_mb:.2f}MB (consider chunking)")
+
+
+def _serialize(data: dict, encoding: str, logger: Any) -> Optional[bytes]:
+    """
+    Serialize dict using the given encoding ('json' or 'msgpack').
+
+    Returns:
+        Payload bytes, or None on error
+    """
+    if encoding == "msgpack":
+        return _serialize_msgpack(data, logger)
+    return _serialize_json(data, logger)
+
+
+def _deserialize(body: bytes, properties: Any, logger: Any) -> Optional[dict]:
+    """
+    Deserialize message body, picking the decoder from its content_type.
+
+    Messages without content_type (older producers, other clients) are read as JSON.
+
+    Returns:
+        Dictionary, or None on malformed payload
+
+    Raises:
+        ImportError: If a msgpack message arrives and msgpack is not installed
+    """
+    if properties is not None and properties.content_type == _MSGPACK_CONTENT_TYPE:
+        return _deserialize_msgpack(body, logger)
+    return _deserialize_json(body, logger)
+
+
+def _serialize_json(data: dict, logger: Any) -> Optional[bytes]:
     """
-    Serialize dict to JSON string with error handling.
+    Serialize dict to UTF-8 JSON bytes with error handling.
+
+    Uses orjson when installed (compact, UTF-8 bytes directly), stdlib json otherwise
+    or when orjson rejects the data (see _dumps_json).
 
     Args:
         data: Dictionary to serialize
         logger: Logger instance
 
     Returns:
-        JSON string, or None on error
+        JSON bytes, or None on error
     """
     try:
-        # Serialize with compact encoding, preserve Unicode
-        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
-
-        # Warn on large payloads (>1MB)
-        size_bytes = len(payload.encode("utf-8"))
-        if size_bytes > 1_000_000:
-            size_mb = size_bytes / 1_000_000
-            logger.warning(f"Large payload: {size_mb:.2f}MB (consider chunking)")
-
+        payload = _dumps_json(data)
+        _warn_if_large(payload, logger)
         return payload
 
     except (TypeError, ValueError) as e:
@@ -193,20 +388,27 @@ def _deserialize_json(body: bytes, logger: Any) -> Optional[dict]:
         Dictionary, or None on error
     """
     try:
-        # Decode bytes to string
-        text = body.decode("utf-8")
-
-        # Parse JSON
-        data = json.loads(text)
-
-        # Validate it's a dict
-        if not isinstance(data, dict):
-            logger.error(f"Expected dict, got {type(data).__name__}: {text[:100]}")
+        if orjson is not None:
+            # Parses bytes directly (UTF-8 errors surface as JSONDecodeError)
+            try:
+                data = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                # NaN/Infinity tokens (written by stdlib producers) - stdlib parses them,
+                # and re-raises for genuinely malformed bodies
+                data = json.loads(body)
+        else:
+            # json.loads() accepts bytes too - no intermediate str copy of the body
+            data = json.loads(body)
+
+        # Validate it's a dict (exact type check - JSON objects always parse to plain dict)
+        if type(data) is not dict:
+            logger.error(f"Expected dict, got {type(data).__name__}: {body[:100]}")
             return None
 
         return data
 
     except UnicodeDecodeError as e:
+        # stdlib path only (orjson reports bad UTF-8 as JSONDecodeError)
         logger.error(f"Invalid UTF-8 encoding: {e}")
         return None
 
@@ -215,6 +417,179 @@ def _deserialize_json(body: bytes, logger: Any) -> Optional[dict]:
         return None
 
 
+def _serialize_msgpack(data: dict, logger: Any) -> Optional[bytes]:
+    """
+    Serialize dict to MessagePack bytes with error handling.
+
+    Args:
+        data: Dictionary to serialize
+        logger: Logger instance
+
+    Returns:
+        MessagePack bytes, or None on error
+    """
+    try:
+        payload = msgpack.packb(data, use_bin_type=True)
+        _warn_if_large(payload, logger)
+        return payload
+
+    except (TypeError, ValueError, OverflowError) as e:
+        logger.error(f"msgpack serialization failed: {e}")
+        return None
+
+
+def _deserialize_msgpack(body: bytes, logger: Any) -> Optional[dict]:
+    """
+    Deserialize MessagePack bytes to dict with error handling.
+
+    Args:
+        body: Raw message body (bytes)
+        logger: Logger instance
+
+    Returns:
+        Dictionary, or None on malformed payload
+
+    Raises:
+        ImportError: If msgpack is not installed - a consumer configuration error,
+            not a bad message (must not be rejected as malformed)
+    """
+    if msgpack is None:
+        raise ImportError(
+            "Received application/msgpack message but 'msgpack' library is not installed. "
+            "Install with: pip install msgpack"
+        )
+
+    try:
+        data = msgpack.unpackb(body, raw=False)
+
+        # Validate it's a dict (unpackb builds plain dicts)
+        if type(data) is not dict:
+            logger.error(f"Expected dict, got {type(data).__name__}: {body[:100]}")
+            return None
+
+        return data
+
+    except (TypeError, ValueError) as e:
+        logger.error(f"Invalid msgpack: {e!r} - Body: {body[:100]}")
+        return None
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Connection pool (send_json)
+
+
+class _PooledConnection:
+    """Open connection/channel reused by send_json(), plus queues already declared on it."""
+
+    __slots__ = ('connection', 'channel', 'declared')
+
+    def __init__(self, connection: pika.BlockingConnection):
+        self.connection = connection
+        self.channel = connection.channel()
+        # Publisher confirms - a publish into a silently dropped connection must fail,
+        # not just land in the kernel send buffer
+        self.channel.confirm_delivery()
+        self.declared: set = set()
+
+    def is_open(self) -> bool:
+        return self.connection.is_open and self.channel.is_open
+
+    def close(self):
+        try:
+            if self.connection.is_open:
+                self.connection.close()
+        except Exception:
+            pass  # Already broken - nothing left to release
+
+
+# (host, port, virtual_host, username, password) -> _PooledConnection
+_CONNECTION_POOL: dict = {}
+# pika connections are not thread-safe - held for the whole declare+publish
+_POOL_LOCK = threading.Lock()
+# Pooled connections sit idle between calls - heartbeat lets the broker close dead
+# ones visibly and bounds a confirm wait on a silently dropped connection
+_POOL_HEARTBEAT = 60
+
+
+def _reset_pool_in_child():
+    """Forget inherited pooled connections in a forked child (never share the parent's AMQP socket)."""
+    global _POOL_LOCK
+    _CONNECTION_POOL.clear()  # No close() - that would send frames on the parent's connection
+    _POOL_LOCK = threading.Lock()  # May have been held by another parent thread at fork time
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_pool_in_child)
+
+
+def _pooled_publish(
+    key: tuple,
+    params: pika.ConnectionParameters,
+    queue: str,
+    declare_queue: bool,
+    payload: bytes,
+    properties: pika.BasicProperties,
+    logger: Any
+) -> None:
+    """
+    Publish over a pooled connection (opened on first use, reopened if dropped).
+
+    Publishes are confirmed by the broker before returning. A reused connection
+    that turns out to be dead (e.g. broker restart, idle connection dropped) is
+    replaced and the publish retried once; errors on a fresh connection propagate.
+    A retry after a lost confirm may deliver the message twice (at-least-once).
+
+    Raises:
+        AMQPConnectionError, AMQPChannelError: On broker/channel failure
+        NackError: If the broker rejects the message
+    """
+    with _POOL_LOCK:
+        while True:
+            entry = _CONNECTION_POOL.get(key)
+            reused = entry is not None and entry.is_open()
+            if not reused:
+                if entry is not None:
+                    entry.close()
+                    del _CONNECTION_POOL[key]
+
+                connection = pika.BlockingConnection(params)
+                try:
+                    entry = _PooledConnection(connection)  # channel() + confirm_delivery() may fail
+                except Exception:
+                    try:
+                        connection.close()  # Not pooled yet - nobody else would release it
+                    except Exception:
+                        pass
+                    raise
+                _CONNECTION_POOL[key] = entry
+                logger.debug(f"Pooled connection opened to {key[0]}:{key[1]}")
+
+            try:
+                if declare_queue and queue not in entry.declared:
+                    entry.channel.queue_declare(queue=queue)
+                    entry.declared.add(queue)
+                    logger.debug(f"Queue '{queue}' declared")
+
+                entry.channel.basic_publish("", queue, payload, properties)
+                return
+
+            except (AMQPConnectionError, AMQPChannelError) as e:
+                entry.close()
+                del _CONNECTION_POOL[key]
+                if not reused:
+                    raise
+                logger.debug(f"Pooled connection to {key[0]}:{key[1]} lost ({e!r}), reconnecting")
+
+
+@atexit.register
+def _close_pool():
+    """Close all pooled send_json() connections (interpreter exit)."""
+    with _POOL_LOCK:
+        for entry in _CONNECTION_POOL.values():
+            entry.close()
+        _CONNECTION_POOL.clear()
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Producer functions (one-shot)
 
@@ -229,13 +604,20 @@ def send_json(
     password: Optional[str] = None,
     declare_queue: bool = True,
     timeout: float = 5.0,
-    logger: Optional[Any] = None
+    logger: Optional[Any] = None,
+    encoding: str = "json",
+    pool: bool = True
 ) -> bool:
     """
-    Send a JSON message to RabbitMQ queue (one-shot connection).
+    Send a JSON message to RabbitMQ queue (one-shot call, pooled connection).
 
-    Opens connection, sends message, closes connection. Suitable for
-    infrequent sends. For high-frequency sending, use RMQProducer class.
+    By default the connection is kept open in a module-level pool (one per
+    host/port/vhost/credentials) and reused by later calls, so repeated sends
+    skip the TCP + AMQP handshake. Pooled publishes use publisher confirms, so
+    True means the broker accepted the message. Pooled connections are closed
+    at interpreter exit and are not inherited by forked children. With
+    pool=False, opens connection, sends message, closes connection.
+    For batching and explicit lifecycle control, use RMQProducer class.
 
     Args:
         data: Dictionary to send as JSON payload
@@ -248,10 +630,16 @@ def send_json(
         declare_queue: Auto-declare queue if it doesn't exist
         timeout: Connection timeout in seconds (unused, for future)
         logger: Optional logger instance (defaults to stdlib logging)
+        encoding: Payload encoding - 'json' or 'msgpack' (requires msgpack)
+        pool: Reuse a pooled connection (False = connect/close per call)
 
     Returns:
         True if message sent successfully, False otherwise
 
+    Raises:
+        ValueError: If encoding is unknown
+        ImportError: If encoding='msgpack' and msgpack is not installed
+
     Examples:
         >>> send_json({'task': 'process'}, 'work_queue')
         True
@@ -259,28 +647,45 @@ def send_json(
         >>> send_json({'data': [1,2,3]}, 'tasks', host='rmq.prod.com',
         ...           username='worker', password='secret')
         True
+
+        >>> send_json({'readings': [1.5, 2.5]}, 'metrics', encoding='msgpack')
+        True
+
+        >>> send_json({'event': 'shutdown'}, 'events', pool=False)  # No lingering connection
+        True
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    _check_encoding(encoding)
+
     # Input validation
     if not isinstance(data, dict):
         logger.error(f"send_json() requires dict, got {type(data).__name__}")
         return False
 
     try:
-        # Serialize to JSON
-        payload = _serialize_json(data, logger)
+        # Serialize (JSON or msgpack)
+        payload = _serialize(data, encoding, logger)
         if payload is None:
             return False
 
-        # Build connection params (heartbeat=0 for one-shot)
+        # Build connection params (heartbeat=0 for one-shot, _POOL_HEARTBEAT for pooled)
         params = _get_connection_params(
             host, port, virtual_host, username, password,
-            heartbeat=0,
+            heartbeat=_POOL_HEARTBEAT if pool else 0,
             logger=logger
         )
 
+        if pool:
+            _pooled_publish(
+                (host, port, virtual_host, username, password), params,
+                queue, declare_queue, payload, _PROPERTIES[encoding], logger
+            )
+            if _log_enabled(logger, logging.INFO):
+                logger.info(f"Sent {len(data)} keys to {host}/{queue}")
+            return True
+
         # Connect and send
         with pika.BlockingConnection(params) as connection:
             channel = connection.channel()
@@ -292,7 +697,8 @@ def send_json(
             channel.basic_publish(
                 exchange="",
                 routing_key=queue,
-                body=payload
+                body=payload,
+                properties=_PROPERTIES[encoding]
             )
 
             logger.info(f"Sent {len(data)} keys to {host}/{queue}")
@@ -355,7 +761,8 @@ class RMQProducer:
         declare_queue: bool = True,
         heartbeat: int = 600,
         enabled: bool = True,
-        logger: Optional[Any] = None
+        logger: Optional[Any] = None,
+        encoding: str = "json"
     ):
         """
         Initialize producer (connection opened on first send or explicit connect()).
@@ -371,7 +778,14 @@ class RMQProducer:
             heartbeat: Heartbeat interval in seconds (0 = disabled)
             enabled: If False, send() logs warning and no-ops (for dev/testing)
             logger: Optional logger instance
+            encoding: Payload encoding - 'json' or 'msgpack' (requires msgpack)
+
+        Raises:
+            ValueError: If encoding is unknown
+            ImportError: If encoding='msgpack' and msgpack is not installed
         """
+        _check_encoding(encoding)
+
         self.queue = queue
         self.host = host
         self.enabled = enabled
@@ -381,6 +795,15 @@ class RMQProducer:
         # Connection state
         self._connection: Optional[pika.BlockingConnection] = None
         self._channel = None
+        self._tx_channel = None  # Separate transactional channel for send_many()
+
+        # Publish routing (default exchange, queue name as routing key)
+        self._exchange = ""
+        self._routing_key = queue
+
+        # Payload encoding and its shared message properties (content_type)
+        self.encoding = encoding
+        self._properties = _PROPERTIES[encoding]
 
         # Store params for lazy connection
         self._params = _get_connection_params(
@@ -406,6 +829,7 @@ class RMQProducer:
         try:
             self._connection = pika.BlockingConnection(self._params)
             self._channel = self._connection.channel()
+            self._tx_channel = None
 
             if self.declare_queue:
                 self._channel.queue_declare(queue=self.queue)
@@ -443,17 +867,15 @@ class RMQProducer:
                 return False
 
         try:
-            payload = _serialize_json(data, self._logger)
+            payload = _serialize(data, self.encoding, self._logger)
             if payload is None:
                 return False
 
-            self._channel.basic_publish(
-                exchange="",
-                routing_key=self.queue,
-                body=payload
-            )
+            self._channel.basic_publish(self._exchange, self._routing_key, payload, self._properties)
 
-            self._logger.info(f"Sent {len(data)} keys to {self.queue}")
+            # Per-publish log - message only built when INFO is enabled
+            if _log_enabled(self._logger, logging.INFO):
+                self._logger.info(f"Sent {len(data)} keys to {self.queue}")
             return True
 
         except AMQPChannelError as e:
@@ -464,6 +886,82 @@ class RMQProducer:
             self._logger.error(f"Send error: {e}")
             return False
 
+    def send_many(self, datas: list[dict], batch_size: int = 100) -> int:
+        """
+        Send multiple JSON messages in transactional batches (opens connection if needed).
+
+        Publishes are grouped into AMQP transactions of batch_size messages,
+        so the broker round trip is paid once per batch instead of per message.
+        Uses a separate channel, so send() on the same producer is unaffected.
+
+        Args:
+            datas: List of dictionaries to send as JSON
+            batch_size: Messages per transaction commit
+
+        Returns:
+            Number of messages sent (committed). Messages that fail validation
+            or serialization are skipped (logged); on channel error, returns
+            the count committed before the failure.
+
+        Examples:
+            >>> with RMQProducer('tasks') as producer:
+            ...     producer.send_many([{'id': i} for i in range(1000)])
+            1000
+        """
+        if not self.enabled:
+            self._logger.warning(f"Send disabled to {self.host}/{self.queue}")
+            return len(datas)  # Considered "success" for enabled=False mode
+
+        # Ensure connected
+        if not self._connection or not self._connection.is_open:
+            if not self.connect():
+                return 0
+
+        # Serialize up front - invalid messages skipped. Encoder call, error
+        # handling and size check are inlined (one call per message, not three)
+        logger = self._logger
+        encode = _raw_encoder(self.encoding)
+        payloads = []
+        append = payloads.append
+        for data in datas:
+            if not isinstance(data, dict):
+                logger.error(f"send_many() requires dicts, got {type(data).__name__}")
+                continue
+            try:
+                payload = encode(data)
+            except (TypeError, ValueError, OverflowError) as e:
+                logger.error(f"{self.encoding} serialization failed: {e}")
+                continue
+            if len(payload) > _LARGE_PAYLOAD_BYTES:
+                _warn_if_large(payload, logger)
+            append(payload)
+
+        sent = 0
+        try:
+            if self._tx_channel is None or not self._tx_channel.is_open:
+                self._tx_channel = self._connection.channel()
+                self._tx_channel.tx_select()
+
+            publish = self._tx_channel.basic_publish
+            exchange, routing_key, properties = self._exchange, self._routing_key, self._properties
+            for start in range(0, len(payloads), batch_size):
+                batch = payloads[start:start + batch_size]
+                for payload in batch:
+                    publish(exchange, routing_key, payload, properties)
+                self._tx_channel.tx_commit()
+                sent += len(batch)
+
+            self._logger.info(f"Sent {sent} messages to {self.queue}")
+            return sent
+
+        except AMQPChannelError as e:
+            self._logger.error(f"Channel error after {sent} messages: {e}")
+            return sent
+
+        except Exception as e:
+            self._logger.error(f"Send error after {sent} messages: {e}")
+            return sent
+
     def close(self):
         """Close connection gracefully."""
         if self._connection and self._connection.is_open:
@@ -480,6 +978,79 @@ class RMQProducer:
         self.close()
 
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Async producer facade (asyncio over RMQProducer)
+
+
+class AsyncRMQProducer:
+    """
+    asyncio facade over RMQProducer for event-loop based applications.
+
+    Blocking pika calls run in a dedicated single-thread executor, so the
+    event loop is never blocked and all channel operations stay on one
+    thread (pika connections are not thread-safe). Concurrent send() calls
+    from many coroutines are serialized in submission order.
+
+    Examples:
+        >>> async with AsyncRMQProducer('tasks', host='rmq.local') as producer:
+        ...     await producer.send({'task': 'first'})
+        ...     await producer.send_many([{'id': i} for i in range(100)])
+        True
+        100
+
+        >>> # Fan-out from many coroutines
+        >>> await asyncio.gather(*(producer.send({'id': i}) for i in range(1000)))
+    """
+
+    def __init__(self, queue: str, host: str = "localhost", **kwargs):
+        """
+        Initialize async producer (connection opened on first send or explicit connect()).
+
+        Args:
+            queue: Target queue name
+            host: RabbitMQ broker hostname
+            **kwargs: Any other RMQProducer argument (port, username, logger, ...)
+        """
+        self.queue = queue
+        self.host = host
+        self._sync = RMQProducer(queue, host, **kwargs)
+        self._executor: Optional[ThreadPoolExecutor] = None  # Created on first use, released by close()
+
+    async def _run(self, func: Callable, *args) -> Any:
+        if self._executor is None:
+            # (Re)created lazily - the producer stays usable after close(), like RMQProducer
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rmq-producer")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def connect(self) -> bool:
+        """Explicitly open connection (lazy - also happens on first send())."""
+        return await self._run(self._sync.connect)
+
+    async def send(self, data: dict) -> bool:
+        """Send JSON message, see RMQProducer.send()."""
+        return await self._run(self._sync.send, data)
+
+    async def send_many(self, datas: list[dict], batch_size: int = 100) -> int:
+        """Send messages in transactional batches, see RMQProducer.send_many()."""
+        return await self._run(self._sync.send_many, datas, batch_size)
+
+    async def close(self):
+        """Close connection gracefully and release the worker thread (later calls reconnect)."""
+        await self._run(self._sync.close)
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Consumer function
 
@@ -493,13 +1064,16 @@ def consume_json(
     username: Optional[str] = None,
     password: Optional[str] = None,
     heartbeat: int = 1200,
-    logger: Optional[Any] = None
+    logger: Optional[Any] = None,
+    prefetch: int = 100,
+    ack_batch: int = 1
 ):
     """
     Blocking consumer for JSON messages with manual acknowledgment.
 
     Automatically starts consuming, blocks forever. Messages are acknowledged
     AFTER successful callback execution, providing natural retry on failure.
+    Payloads are decoded by content_type (msgpack or JSON - the default).
 
     Args:
         queue: Queue name to consume from
@@ -511,6 +1085,14 @@ def consume_json(
         password: Authentication password
         heartbeat: Heartbeat interval in seconds
         logger: Optional logger instance
+        prefetch: Max unacknowledged messages the broker pushes ahead (0 = unlimited)
+        ack_batch: Acknowledge every N successful messages with a single
+            multiple=True ack (1 = ack each message)
+
+    Raises:
+        ValueError: If ack_batch exceeds a non-zero prefetch (consumer would stall)
+        ImportError: If a msgpack message arrives and msgpack is not installed
+            (consumer stops, message left unacked and requeued by the broker)
 
     Examples:
         >>> def process_task(data: dict):
@@ -521,6 +1103,9 @@ def consume_json(
         >>> consume_json('work_queue', process_task)
         # Blocks forever, processing messages
 
+        >>> # High throughput: ack every 50 messages in one round-trip
+        >>> consume_json('work_queue', process_task, prefetch=200, ack_batch=50)
+
     Note:
         This function blocks indefinitely. Use Ctrl+C to stop (or wrap in
         catch_signals.assist_signals() for graceful shutdown).
@@ -528,10 +1113,23 @@ def consume_json(
         Messages are acknowledged AFTER callback completes successfully.
         If callback raises exception, message is NOT acknowledged and will
         be redelivered (natural retry mechanism).
+
+        With ack_batch > 1, successfully processed messages are acknowledged
+        in groups. Up to ack_batch - 1 processed messages may stay unacked
+        (and be redelivered if the consumer dies) until the batch fills or
+        the consumer stops.
+
+        Throughput: pika decodes AMQP frames in pure Python, which caps a
+        single consumer process. Raise prefetch/ack_batch first; beyond that,
+        run several consumer processes on the same queue (the broker
+        round-robins messages between them).
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    if prefetch and ack_batch > prefetch:
+        raise ValueError(f"ack_batch ({ack_batch}) cannot exceed prefetch ({prefetch})")
+
     params = _get_connection_params(
         host, port, virtual_host, username, password, heartbeat, logger
     )
@@ -539,27 +1137,45 @@ def consume_json(
     connection = pika.BlockingConnection(params)
     channel = connection.channel()
     channel.queue_declare(queue=queue)
+    channel.basic_qos(prefetch_count=prefetch)
+
+    # Processed-but-unacked messages: count and delivery tag of the latest one
+    pending = 0
+    last_tag = 0
+
+    def _flush_acks(ch):
+        nonlocal pending
+        if pending:
+            ch.basic_ack(delivery_tag=last_tag, multiple=True)
+            pending = 0
 
     # Wrapper to deserialize JSON, call callback, then ack (or nack+requeue, if callback fails)
     def _internal_callback(ch, method, properties, body):
-        data = _deserialize_json(body, logger)
+        nonlocal pending, last_tag
+        data = _deserialize(body, properties, logger)
         if data is None:
-            # JSON parse failed - reject message (don't requeue)
+            # JSON/msgpack parse failed - reject message (don't requeue)
+            _flush_acks(ch)
             ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-            logger.warning("Message with invalid JSON rejected (not requeued)")
+            logger.warning("Message with invalid payload rejected (not requeued)")
             return
 
         try:
             # Execute user callback
             callback(data)
 
-            # Acknowledge AFTER successful processing
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-
         except Exception as e:
-            # Callback failed - nack with requeue for immediate retry
+            # Callback failed - ack earlier successes, then nack with requeue for immediate retry
+            _flush_acks(ch)
             ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
             logger.error(f"Callback failed, message requeued for retry: {e}")
+            return
+
+        # Acknowledge AFTER successful processing (every ack_batch messages)
+        pending += 1
+        last_tag = method.delivery_tag
+        if pending >= ack_batch:
+            _flush_acks(ch)
 
     channel.basic_consume(
         queue=queue,
@@ -574,3 +1190,141 @@ def consume_json(
     except KeyboardInterrupt:
         logger.warning("Consumer stopped by user")
         channel.stop_consuming()
+        _flush_acks(channel)
+    except ImportError:
+        # Missing decoder (msgpack) - stop without touching the current message; closing
+        # the connection makes the broker requeue it for a correctly configured consumer
+        _flush_acks(channel)
+        connection.close()
+        raise
+
+
+async def consume_json_async(
+    queue: str,
+    host: str = "localhost",
+    port: int = 5672,
+    virtual_host: str = "/",
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    heartbeat: int = 1200,
+    logger: Optional[Any] = None,
+    prefetch: int = 100
+) -> AsyncIterator[dict]:
+    """
+    Async consumer for JSON messages - async generator yielding dicts.
+
+    pika runs in a background I/O thread and feeds deserialized messages to
+    the event loop through an asyncio.Queue. Payloads are decoded by
+    content_type, like consume_json(). A message is acknowledged when the
+    loop body finishes with it (i.e. when the next message is requested).
+    If the loop body raises or breaks, the connection is closed and the
+    broker requeues every unacknowledged message, including the current one.
+    At most prefetch messages are in flight (buffered or being processed),
+    so a slow loop body does not pull the whole queue into memory.
+
+    Args:
+        queue: Queue name to consume from
+        host: RabbitMQ broker hostname
+        port: RabbitMQ broker port
+        virtual_host: Virtual host name
+        username: Authentication username
+        password: Authentication password
+        heartbeat: Heartbeat interval in seconds
+        logger: Optional logger instance
+        prefetch: Max unacknowledged messages the broker pushes ahead (0 = unlimited)
+
+    Yields:
+        Message payloads as dicts (malformed payloads rejected without requeue)
+
+    Raises:
+        AMQPConnectionError: If connecting to the broker fails
+        ImportError: If a msgpack message arrives and msgpack is not installed
+            (consumer stops, message left unacked and requeued by the broker)
+
+    Examples:
+        >>> async for data in consume_json_async('work_queue'):
+        ...     await handle(data)  # Acked once the next message is requested
+
+        >>> # Stop early and release the connection immediately
+        >>> from contextlib import aclosing
+        >>> async with aclosing(consume_json_async('work_queue')) as messages:
+        ...     async for data in messages:
+        ...         if data.get('last'):
+        ...             break
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    params = _get_connection_params(
+        host, port, virtual_host, username, password, heartbeat, logger
+    )
+
+    loop = asyncio.get_running_loop()
+    messages: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    io: dict = {}  # connection/channel, set by the I/O thread before consuming
+
+    def _on_message(ch, method, properties, body):
+        data = _deserialize(body, properties, logger)
+        if data is None:
+            # JSON/msgpack parse failed - reject message (don't requeue)
+            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            logger.warning("Message with invalid payload rejected (not requeued)")
+            return
+        loop.call_soon_threadsafe(messages.put_nowait, (method.delivery_tag, data))
+
+    def _io_thread():
+        connection = None
+        try:
+            connection = pika.BlockingConnection(params)
+            channel = connection.channel()
+            channel.queue_declare(queue=queue)
+            channel.basic_qos(prefetch_count=prefetch)
+            io["connection"], io["channel"] = connection, channel
+            channel.basic_consume(queue=queue, on_message_callback=_on_message, auto_ack=False)
+            logger.info(f"Starting async consumer on {host}/{queue}")
+
+            while not stop.is_set():
+                connection.process_data_events(time_limit=0.5)
+
+            # Run acks queued via add_callback_threadsafe() just before stop was set -
+            # otherwise close() drops them and the broker redelivers processed messages
+            connection.process_data_events(time_limit=0)
+
+        except Exception as e:
+            # Surface connection/channel errors to the consuming coroutine (stored first,
+            # so buffered messages are neither yielded nor acked on the dead connection)
+            io["error"] = e
+            loop.call_soon_threadsafe(messages.put_nowait, e)
+
+        finally:
+            if connection is not None and connection.is_open:
+                connection.close()  # Broker requeues anything unacked
+
+    thread = threading.Thread(target=_io_thread, name="rmq-consumer", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = await messages.get()
+            if isinstance(item, Exception):
+                raise item
+            if "error" in io:
+                # I/O thread died - buffered messages are redelivered by the broker, don't process them
+                raise io["error"]
+
+            delivery_tag, data = item
+            yield data
+
+            if "error" in io:
+                raise io["error"]  # Connection gone while the loop body ran - nothing to ack on
+
+            # Loop body completed - acknowledge on the pika I/O thread
+            io["connection"].add_callback_threadsafe(
+                functools.partial(io["channel"].basic_ack, delivery_tag=delivery_tag)
+            )
+
+    finally:
+        stop.set()
+        await loop.run_in_executor(None, thread.join)
+        logger.info(f"Async consumer on {host}/{queue} stopped")
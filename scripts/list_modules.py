@@ -6,52 +6,73 @@ Extracts metadata from module docstrings and displays a catalog.
 """
 
 import ast
+import inspect
 import sys
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import NamedTuple, Optional
 
 
-def extract_module_info(filepath: Path) -> Dict[str, Optional[str]]:
+class ModuleInfo(NamedTuple):
+    """Catalog entry for one module (defaults cover missing docstring metadata)."""
+    name: str
+    description: str = 'No description available'
+    version: str = 'Unknown'
+    author: str = 'Unknown'
+
+
+def read_docstring(filepath: Path) -> Optional[str]:
+    """
+    Read module docstring by tokenizing only up to the first statement.
+
+    Falls back to a full ast.parse() for anything unusual (implicitly
+    concatenated strings - on any line, bytes/f-string literals).
+    """
+    skip = (tokenize.ENCODING, tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE)
+    with open(filepath, 'rb') as f:
+        tokens = (tok for tok in tokenize.tokenize(f.readline) if tok.type not in skip)
+        first = next(tokens, None)
+        if first is None or first.type != tokenize.STRING:
+            return None  # No leading string literal - no docstring
+
+        following = next(tokens, None)
+        try:
+            value = ast.literal_eval(first.string)
+        except (ValueError, SyntaxError):
+            value = None  # f-string - not a literal, let ast decide
+        if isinstance(value, str) and (following is None or following.type != tokenize.STRING):
+            return inspect.cleandoc(value)  # Same cleanup as ast.get_docstring()
+
+        f.seek(0)
+        return ast.get_docstring(ast.parse(f.read()))
+
+
+def extract_module_info(filepath: Path) -> ModuleInfo:
     """Extract metadata from module docstring."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            tree = ast.parse(f.read())
-
-        docstring = ast.get_docstring(tree)
+        docstring = read_docstring(filepath)
         if not docstring:
-            return {
-                'name': filepath.stem,
-                'description': 'No description available',
-                'version': 'Unknown',
-                'author': 'Unknown'
-            }
+            return ModuleInfo(filepath.stem)
 
         # Extract first line as description
         lines = [line.strip() for line in docstring.split('\n') if line.strip()]
         description = lines[0] if lines else 'No description'
 
-        # Extract version and author if present
+        # Extract version and author if present (conventionally at the end - scan backwards)
         version = 'Unknown'
         author = 'Unknown'
-        for line in lines:
-            if line.startswith('Version:'):
-                version = line.split(':', 1)[1].strip()
-            elif line.startswith('Author:'):
-                author = line.split(':', 1)[1].strip()
-
-        return {
-            'name': filepath.stem,
-            'description': description,
-            'version': version,
-            'author': author
-        }
+        for line in reversed(lines):
+            if version == 'Unknown' and line.startswith('Version:'):
+                version = line.removeprefix('Version:').strip()
+            elif author == 'Unknown' and line.startswith('Author:'):
+                author = line.removeprefix('Author:').strip()
+            if version != 'Unknown' and author != 'Unknown':
+                break
+
+        return ModuleInfo(filepath.stem, description, version, author)
     except Exception as e:
-        return {
-            'name': filepath.stem,
-            'description': f'Error reading module: {e}',
-            'version': 'Unknown',
-            'author': 'Unknown'
-        }
+        return ModuleInfo(filepath.stem, f'Error reading module: {e}')
 
 
 def list_modules():
@@ -77,12 +98,14 @@ def list_modules():
     print("╚═══════════════════════════════════════════════════════════════════════════╝")
     print()
 
-    for module_path in modules:
-        info = extract_module_info(module_path)
+    # Read modules in parallel (I/O bound), print in sorted order
+    with ThreadPoolExecutor(max_workers=min(32, len(modules))) as executor:
+        infos = list(executor.map(extract_module_info, modules))
 
-        print(f"📦 {info['name']}")
-        print(f"   {info['description']}")
-        print(f"   Version: {info['version']} | Author: {info['author']}")
+    for info in infos:
+        print(f"📦 {info.name}")
+        print(f"   {info.description}")
+        print(f"   Version: {info.version} | Author: {info.author}")
         print()
 
     print(f"Total modules: {len(modules)}")